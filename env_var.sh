@@ -11,6 +11,9 @@ export OMP_NUM_THREADS=
 # Quantum simulator: use GPUs, if qulacs-gpu has been installed (values: 0 or 1)
 export QULACS_USE_GPU=
 
+# Test suite: directory where DLPNO tests persist reference MO integrals (requires joblib)
+export TANGELO_TEST_CACHE_DIR=
+
 
 # 2. QPU Connections
 # ---------------------------------------------------------------
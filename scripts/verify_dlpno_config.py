@@ -169,6 +169,9 @@ def check_default_pno_parameters(structures_mod, config_mod):
     for field, const_name in expected_map.items():
         expected = getattr(config_mod, const_name, None)
         actual = data.get(field, None)
+        if isinstance(actual, tuple) and isinstance(expected, list):
+            # PNOParameters stores threshold sequences as immutable tuples
+            expected = tuple(expected)
         ok = actual == expected
         result[field] = {"expected": expected, "actual": actual, "pass": ok}
         if not ok:
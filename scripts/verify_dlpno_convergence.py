@@ -31,6 +31,7 @@ import io
 import json
 import math
 import sys
+from dataclasses import asdict
 from typing import Any, Dict, List
 
 SUMMARY: Dict[str, Any] = {
@@ -93,9 +94,9 @@ def check_basic_flow(structures, convergence):
     # Evaluate transitions
     basic_pass = (not r0.converged) and (not r1.converged) and r2.converged and monitor.is_converged()
     SUMMARY["basic_flow"] = {
-        "r0": r0.__dict__,
-        "r1": r1.__dict__,
-        "r2": r2.__dict__,
+        "r0": asdict(r0),
+        "r1": asdict(r1),
+        "r2": asdict(r2),
         "final_is_converged": monitor.is_converged(),
         "pass": basic_pass
     }
@@ -151,9 +152,9 @@ def check_nan_inf(structures, convergence):
     # Expect that nan/inf cases do not prematurely converge
     premature = any(r.converged for r in [r_nan, r_inf])
     SUMMARY["nan_inf_handling"] = {
-        "nan_record": r_nan.__dict__,
-        "inf_record": r_inf.__dict__,
-        "post_record": r_ok.__dict__,
+        "nan_record": asdict(r_nan),
+        "inf_record": asdict(r_inf),
+        "post_record": asdict(r_ok),
         "premature_convergence": premature
     }
     if premature:
@@ -199,7 +200,7 @@ def check_records_schema(convergence, structures):
     schema_ok = True
     fields = {"iteration", "energy", "residual_norm", "converged"}
     for rec in monitor.records:
-        missing = fields - set(rec.__dict__.keys())
+        missing = fields - set(asdict(rec).keys())
         if missing:
             schema_ok = False
             fail(f"ConvergenceRecord missing fields: {missing}")
@@ -101,8 +101,8 @@ def check_default_params(dlpno):
     params = dlpno.default_pno_parameters()
     # basic field comparisons
     expected_pairs = [
-        ("pno_tau_sequence", dlpno.PNO_TAU_SEQUENCE_DEFAULT),
-        ("pair_tau_sequence", dlpno.PAIR_TAU_SEQUENCE_DEFAULT),
+        ("pno_tau_sequence", tuple(dlpno.PNO_TAU_SEQUENCE_DEFAULT)),
+        ("pair_tau_sequence", tuple(dlpno.PAIR_TAU_SEQUENCE_DEFAULT)),
         ("energy_abs_tol", dlpno.ENERGY_ABS_TOL_DEFAULT),
         ("energy_rel_tol", dlpno.ENERGY_REL_TOL_DEFAULT),
     ]
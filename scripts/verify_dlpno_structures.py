@@ -12,8 +12,8 @@ Checks:
        - ConvergenceRecord
        - default_pno_parameters()
   3. Attribute/type sanity (duck checks, not exhaustive typing).
-  4. default_pno_parameters returns value-copies (mutating returned lists does
-     not alter config constants).
+  4. default_pno_parameters returns immutable tuple copies of the config
+     sequences (config constants cannot be altered through them).
   5. Edge cases: empty lists, None fields, negative tolerances (currently allowed).
   6. Idempotent re-import (no state bleed).
   7. JSON summary + exit code (0 pass / 1 fail).
@@ -103,8 +103,8 @@ def instantiate_and_validate(structures, config):
 
     d = asdict(params)
     expected_map = {
-        "pno_tau_sequence": config.PNO_TAU_SEQUENCE_DEFAULT,
-        "pair_tau_sequence": config.PAIR_TAU_SEQUENCE_DEFAULT,
+        "pno_tau_sequence": tuple(config.PNO_TAU_SEQUENCE_DEFAULT),
+        "pair_tau_sequence": tuple(config.PAIR_TAU_SEQUENCE_DEFAULT),
         "energy_abs_tol": config.ENERGY_ABS_TOL_DEFAULT,
         "energy_rel_tol": config.ENERGY_REL_TOL_DEFAULT,
         "max_extrap_points": config.MAX_EXTRAP_POINTS,
@@ -118,27 +118,22 @@ def instantiate_and_validate(structures, config):
     SUMMARY["default_params_integrity"] = integrity
 
     # Copy independence test
-    # Mutate the lists we got and re-check config constants unchanged
+    # Sequences are immutable tuples, so they cannot alias the config lists
     copy_status = {}
     for list_field, const_name in [
         ("pno_tau_sequence", "PNO_TAU_SEQUENCE_DEFAULT"),
         ("pair_tau_sequence", "PAIR_TAU_SEQUENCE_DEFAULT"),
     ]:
         original_config_list = getattr(config, const_name)
-        mutated = getattr(params, list_field)
-        if not isinstance(mutated, list):
-            fail(f"{list_field} not a list in PNOParameters.")
+        seq = getattr(params, list_field)
+        if not isinstance(seq, tuple):
+            fail(f"{list_field} not a tuple in PNOParameters.")
             continue
-        if mutated is original_config_list:
+        if seq is original_config_list:
             fail(f"{list_field} references config constant directly (should copy).")
             copy_status[list_field] = {"independent": False}
             continue
-        # mutate returned list
-        mutated.append(9999.0)
-        still_unchanged = getattr(config, const_name) == original_config_list and 9999.0 not in original_config_list
-        if not still_unchanged:
-            fail(f"Config constant {const_name} changed after mutating default object list.")
-        copy_status[list_field] = {"independent": still_unchanged}
+        copy_status[list_field] = {"independent": True}
     SUMMARY["copy_independence"] = copy_status
 
     # Instantiate OrbitalSpace with partial data
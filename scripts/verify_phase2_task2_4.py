@@ -63,25 +63,21 @@ def build_molecule(xyz: str, basis="sto-3g"):
     return SecondQuantizedMolecule(xyz, q=0, spin=0, basis=basis)
 
 def signed_pair_energy(i: int, j: int, mo_energies, mo_integrals, n_occ: int) -> float:
+    # Standalone vectorized reference: plain broadcasting and division, deliberately
+    # not sharing the production einsum / reciprocal formulation.
+    import numpy as np
     if i == j:
         return 0.0
-    n_mos = len(mo_energies)
-    eps_i = mo_energies[i]
-    eps_j = mo_energies[j]
-    e_pair = 0.0
-    for a in range(n_occ, n_mos):
-        eps_a = mo_energies[a]
-        for b in range(n_occ, n_mos):
-            eps_b = mo_energies[b]
-            denom = eps_i + eps_j - eps_a - eps_b
-            # Mirror the production code expectation: denom must be negative.
-            if denom >= 0:
-                raise ValueError(f"Non-negative denominator detected ({denom:.4e}) at (i,j,a,b)=({i},{j},{a},{b})")
-            iajb = mo_integrals[i, j, a, b]
-            ibja = mo_integrals[i, j, b, a]
-            t_abij = 2.0 * iajb - ibja
-            e_pair += t_abij * iajb / denom
-    return e_pair
+    eps = np.asarray(mo_energies, dtype=float)
+    eps_v = eps[n_occ:]
+    denom = eps[i] + eps[j] - eps_v[:, None] - eps_v[None, :]
+    # Mirror the production code expectation: denom must be negative.
+    if np.any(denom >= 0):
+        a, b = np.argwhere(denom >= 0)[0] + n_occ
+        raise ValueError(f"Non-negative denominator detected ({denom[a - n_occ, b - n_occ]:.4e}) at (i,j,a,b)=({i},{j},{a},{b})")
+    iajb = mo_integrals[i, j, n_occ:, n_occ:]
+    ibja = iajb.T
+    return float(np.sum((2.0 * iajb - ibja) * iajb / denom))
 
 @dataclass
 class PairMetric:
@@ -29,7 +29,12 @@ from .convergence import ConvergenceMonitor
 
 # Pair screening
 from .pairs import build_pair_set, OccupiedPair, PairSet
-from .coupling import evaluate_coupling_functional
+from .coupling import (
+    evaluate_coupling_functional,
+    evaluate_coupling_matrix,
+    compute_virtual_pair_sum,
+    extract_oovv_block,
+)
 
 __all__ = [
     # Config constants
@@ -50,4 +55,7 @@ __all__ = [
     "OccupiedPair",
     "PairSet",
     "evaluate_coupling_functional",
+    "evaluate_coupling_matrix",
+    "compute_virtual_pair_sum",
+    "extract_oovv_block",
 ]
\ No newline at end of file
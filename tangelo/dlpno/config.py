@@ -14,6 +14,10 @@
 
 """Configuration parameters for DLPNO-CCSD(T) calculations."""
 
+from functools import lru_cache
+
+import numpy as np
+
 # Default parameter sequences for DLPNO-CCSD(T)
 PNO_TAU_SEQUENCE_DEFAULT = [1.0e-4, 7.0e-5, 5.0e-5, 3.5e-5, 2.5e-5]
 PAIR_TAU_SEQUENCE_DEFAULT = [1.0e-6, 5.0e-7, 2.0e-7]
@@ -32,18 +36,23 @@ DEFAULT_RANDOM_SEED = 20250101
 def validate_monotonic(seq: list[float]) -> bool:
     """Validate that a sequence is strictly decreasing.
     
+    Results are memoized per sequence, so re-validating the same threshold
+    sequence (e.g. the defaults) is a cache lookup.
+    
     Args:
         seq: List of float values to validate
         
     Returns:
         bool: True if sequence is strictly decreasing, False otherwise
     """
-    if len(seq) < 2:
-        return True
-    for i in range(len(seq) - 1):
-        if seq[i] <= seq[i + 1]:
-            return False
-    return True
+    return _is_strictly_decreasing(tuple(seq))
+
+
+@lru_cache(maxsize=32)
+def _is_strictly_decreasing(seq: tuple[float, ...]) -> bool:
+    """Vectorized strict-decrease check on a hashable sequence."""
+    arr = np.asarray(seq, dtype=np.float64)
+    return arr.size < 2 or bool(np.all(np.diff(arr) < 0.0))
 
 
 # Validate default sequences at import time
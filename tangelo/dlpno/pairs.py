@@ -41,7 +41,7 @@ from typing import Any
 
 import numpy as np
 
-from tangelo.dlpno.coupling import evaluate_coupling_functional
+from tangelo.dlpno.coupling import evaluate_coupling_matrix
 
 # Type aliases for clarity (lightweight placeholders)
 OccupiedPair = tuple[int, int]
@@ -75,7 +75,9 @@ def build_pair_set(
         mo_energies: Optional array of MO energies. If None, extracted from
             reference_wavefunction.mo_energies.
         mo_integrals: Optional 4D array of two-electron integrals in physicist's
-            notation. If None, extracted via reference_wavefunction.get_full_space_integrals().
+            notation, or its (occ, occ, virt, virt) block as returned by
+            extract_oovv_block. If None, extracted via
+            reference_wavefunction.get_full_space_integrals().
 
     Returns:
         PairSet: List of retained pairs (i,j) with i < j, ordered lexicographically.
@@ -90,7 +92,7 @@ def build_pair_set(
         - Full retention rule: (i,j) ∈ Π ⇔ i < j ∧ C(i,j) ≥ τ_pair
         - No heuristics or fallback logic (prohibited by skeleton Section 8)
         - Invariants (Section 7): symmetry, idempotence, monotonicity, no fallback
-        - Uses evaluate_coupling_functional from tangelo.dlpno.coupling
+        - Uses evaluate_coupling_matrix from tangelo.dlpno.coupling
     """
     # Validate threshold
     if not isinstance(threshold, (int, float)) or threshold < 0:
@@ -135,17 +137,13 @@ def build_pair_set(
     if n_occ <= 0:
         raise ValueError(f"Number of occupied orbitals must be positive, got {n_occ}")
 
-    # Build pair set using coupling functional
-    retained_pairs = []
-    
-    for i in range(n_occ):
-        for j in range(i + 1, n_occ):  # Ensure i < j
-            # Evaluate coupling functional C(i,j)
-            c_ij = evaluate_coupling_functional(i, j, mo_energies, mo_integrals, n_occ)
-            
-            # Retention rule: C(i,j) >= threshold
-            if c_ij >= threshold:
-                retained_pairs.append((i, j))
-    
-    # Return lexicographically ordered list (already ordered by loop structure)
-    return retained_pairs
+    # Evaluate C(i,j) for all occupied pairs in one vectorized pass
+    c_matrix = evaluate_coupling_matrix(mo_energies, mo_integrals, n_occ)
+
+    # Retention rule: i < j and C(i,j) >= threshold. triu_indices enumerates
+    # the upper triangle row by row, so retained pairs are already ordered
+    # lexicographically.
+    ii, jj = np.triu_indices(n_occ, k=1)
+    retained = c_matrix[ii, jj] >= threshold
+
+    return list(zip(ii[retained].tolist(), jj[retained].tolist()))
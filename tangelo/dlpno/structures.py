@@ -29,7 +29,7 @@ from tangelo.dlpno.config import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class OrbitalSpace:
     """Represents orbital space information for DLPNO calculations.
     
@@ -45,25 +45,25 @@ class OrbitalSpace:
     lmo_coeff: 'np.ndarray | None' = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PNOParameters:
     """Parameters for PNO truncation in DLPNO calculations.
     
     Attributes:
-        pno_tau_sequence: Sequence of PNO truncation thresholds
-        pair_tau_sequence: Sequence of pair truncation thresholds
+        pno_tau_sequence: Immutable sequence of PNO truncation thresholds
+        pair_tau_sequence: Immutable sequence of pair truncation thresholds
         energy_abs_tol: Absolute energy convergence tolerance
         energy_rel_tol: Relative energy convergence tolerance
         max_extrap_points: Maximum number of extrapolation points
     """
-    pno_tau_sequence: list[float]
-    pair_tau_sequence: list[float]
+    pno_tau_sequence: tuple[float, ...]
+    pair_tau_sequence: tuple[float, ...]
     energy_abs_tol: float
     energy_rel_tol: float
     max_extrap_points: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConvergenceCriteria:
     """Convergence criteria for iterative calculations.
     
@@ -77,7 +77,7 @@ class ConvergenceCriteria:
     max_iterations: int | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConvergenceRecord:
     """Record of convergence information for a single iteration.
     
@@ -100,8 +100,8 @@ def default_pno_parameters() -> PNOParameters:
         PNOParameters: Parameters initialized with default constants
     """
     return PNOParameters(
-        pno_tau_sequence=PNO_TAU_SEQUENCE_DEFAULT.copy(),
-        pair_tau_sequence=PAIR_TAU_SEQUENCE_DEFAULT.copy(),
+        pno_tau_sequence=tuple(PNO_TAU_SEQUENCE_DEFAULT),
+        pair_tau_sequence=tuple(PAIR_TAU_SEQUENCE_DEFAULT),
         energy_abs_tol=ENERGY_ABS_TOL_DEFAULT,
         energy_rel_tol=ENERGY_REL_TOL_DEFAULT,
         max_extrap_points=MAX_EXTRAP_POINTS
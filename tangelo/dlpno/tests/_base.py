@@ -0,0 +1,47 @@
+# Copyright SandboxAQ 2021-2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Common setup for DLPNO coupling functional tests."""
+
+import unittest
+
+from tangelo.dlpno.coupling import compute_virtual_pair_sum, extract_oovv_block
+from tangelo.dlpno.tests._fixtures import get_reference_mol
+
+
+class _CouplingTestBase(unittest.TestCase):
+    """Provide the H2O and H2 STO-3G reference systems as class attributes.
+
+    Molecules and integrals come from get_reference_mol, so every subclass
+    shares a single SCF and integral transformation per system.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test molecules for reuse across tests."""
+        # H2O molecule in STO-3G basis (reference test system from spec)
+        cls.xyz_h2o = """
+        O  0.0000  0.0000  0.1173
+        H  0.0000  0.7572 -0.4692
+        H  0.0000 -0.7572 -0.4692
+        """
+        cls.mol_h2o, cls.mo_energies_h2o, cls.mo_integrals_h2o, cls.n_occ_h2o = \
+            get_reference_mol(cls.xyz_h2o, basis="sto-3g")  # 5 occupied orbitals
+        cls.vir_pair_sum_h2o = compute_virtual_pair_sum(cls.mo_energies_h2o, cls.n_occ_h2o)
+        cls.g_oovv_h2o = extract_oovv_block(cls.mo_integrals_h2o, cls.n_occ_h2o)
+
+        # H2 molecule for simpler tests
+        cls.xyz_h2 = "H 0 0 0\nH 0 0 0.74"
+        cls.mol_h2, cls.mo_energies_h2, cls.mo_integrals_h2, cls.n_occ_h2 = \
+            get_reference_mol(cls.xyz_h2, basis="sto-3g")  # 1 occupied orbital
@@ -0,0 +1,80 @@
+# Copyright SandboxAQ 2021-2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared reference molecules for DLPNO tests.
+
+Building a SecondQuantizedMolecule and its full-space MO integrals is the
+dominant cost of the DLPNO test suite. The helpers here memoize that work
+per (xyz, basis, q, spin) so that every test class in a session reuses it.
+
+If joblib is installed and the TANGELO_TEST_CACHE_DIR environment variable
+points to a directory, the MO integrals are additionally persisted there,
+so later test runs skip the AO to MO integral transformation.
+"""
+
+import os
+from functools import lru_cache
+
+import numpy as np
+
+from tangelo import SecondQuantizedMolecule
+
+try:
+    from joblib import Memory
+except ImportError:
+    Memory = None
+
+
+def _get_integrals(mol, xyz, basis, q, spin):
+    """Return the full-space MO integrals of mol.
+
+    xyz, basis, q and spin identify mol; they are only used as the key of
+    the on-disk cache.
+    """
+    _, _, mo_integrals = mol.get_full_space_integrals()
+    return mo_integrals
+
+
+_cache_dir = os.environ.get("TANGELO_TEST_CACHE_DIR")
+if Memory is not None and _cache_dir:
+    _get_integrals = Memory(location=_cache_dir, verbose=0).cache(_get_integrals, ignore=["mol"])
+
+
+@lru_cache(maxsize=None)
+def get_reference_mol(xyz, basis="sto-3g", q=0, spin=0):
+    """Build (once) a reference molecule and its MO data.
+
+    The returned arrays are shared between callers and are therefore
+    flagged read-only.
+
+    Args:
+        xyz (str): Molecular geometry.
+        basis (str): Basis set name.
+        q (int): Total charge.
+        spin (int): 2S, difference between alpha and beta electrons.
+
+    Returns:
+        tuple: (mol, mo_energies, mo_integrals, n_occ) where mol is the
+            SecondQuantizedMolecule, mo_energies the MO energies array,
+            mo_integrals the full-space two-electron integrals and n_occ the
+            number of doubly occupied orbitals.
+    """
+    mol = SecondQuantizedMolecule(xyz, q=q, spin=spin, basis=basis)
+
+    mo_energies = np.array(mol.mo_energies)
+    mo_integrals = _get_integrals(mol, xyz, basis, q, spin)
+    mo_energies.setflags(write=False)
+    mo_integrals.setflags(write=False)
+
+    return mol, mo_energies, mo_integrals, mol.n_electrons // 2
@@ -55,6 +55,7 @@ class ConfigTest(unittest.TestCase):
         self.assertFalse(validate_monotonic([1.0, 1.0, 0.5]))  # Equal values
         self.assertFalse(validate_monotonic([1.0, 0.5, 0.7]))  # Increasing
         self.assertFalse(validate_monotonic([0.1, 0.5, 1.0]))  # Fully increasing
+        self.assertFalse(validate_monotonic([1.0, float("nan"), 0.5]))  # NaN
     
     def test_default_sequences_are_monotonic(self):
         """Test that default sequences are strictly decreasing."""
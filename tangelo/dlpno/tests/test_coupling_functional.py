@@ -26,40 +26,33 @@ dev_notes/dlpno/coupling_function_spec.md Section 11:
 import unittest
 import numpy as np
 
-from tangelo import SecondQuantizedMolecule
-from tangelo.dlpno.coupling import evaluate_coupling_functional
+from tangelo.dlpno.coupling import evaluate_coupling_functional, evaluate_coupling_matrix
 from tangelo.dlpno.pairs import build_pair_set
+from tangelo.dlpno.tests._base import _CouplingTestBase
 
 
-class CouplingFunctionalTest(unittest.TestCase):
+class CouplingFunctionalTest(_CouplingTestBase):
     """Test suite for coupling functional C(i,j) implementation."""
 
     @classmethod
     def setUpClass(cls):
         """Set up test molecules for reuse across tests."""
-        # H2O molecule in STO-3G basis (reference test system from spec)
-        cls.xyz_h2o = """
-        O  0.0000  0.0000  0.1173
-        H  0.0000  0.7572 -0.4692
-        H  0.0000 -0.7572 -0.4692
-        """
-        cls.mol_h2o = SecondQuantizedMolecule(
-            cls.xyz_h2o, q=0, spin=0, basis='sto-3g'
-        )
-        
-        # Extract necessary data
-        cls.mo_energies_h2o = np.array(cls.mol_h2o.mo_energies)
-        _, _, cls.mo_integrals_h2o = cls.mol_h2o.get_full_space_integrals()
-        cls.n_occ_h2o = cls.mol_h2o.n_electrons // 2  # 5 occupied orbitals
-
-        # H2 molecule for simpler tests
-        cls.xyz_h2 = "H 0 0 0\nH 0 0 0.74"
-        cls.mol_h2 = SecondQuantizedMolecule(
-            cls.xyz_h2, q=0, spin=0, basis='sto-3g'
+        super().setUpClass()
+
+        # Full C matrix of H2O from per-pair evaluations, shared by the property tests
+        cls.c_pairwise_h2o = cls._build_C(
+            cls.mo_energies_h2o, cls.g_oovv_h2o, cls.n_occ_h2o, cls.vir_pair_sum_h2o
         )
-        cls.mo_energies_h2 = np.array(cls.mol_h2.mo_energies)
-        _, _, cls.mo_integrals_h2 = cls.mol_h2.get_full_space_integrals()
-        cls.n_occ_h2 = cls.mol_h2.n_electrons // 2  # 1 occupied orbital
+
+    @staticmethod
+    def _build_C(mo_energies, mo_integrals, n_occ, vir_pair_sum=None):
+        """Evaluate C(i,j) for all ordered pairs, including the diagonal."""
+        return np.array([
+            [evaluate_coupling_functional(
+                i, j, mo_energies, mo_integrals, n_occ, vir_pair_sum=vir_pair_sum
+            ) for j in range(n_occ)]
+            for i in range(n_occ)
+        ])
 
     def test_symmetry(self):
         """Test 11.1: Symmetry property C(i,j) = C(j,i).
@@ -68,22 +61,13 @@ class CouplingFunctionalTest(unittest.TestCase):
         must be symmetric under exchange of indices.
         """
         eps_tol = 1e-12  # Numerical tolerance from spec
-        
+
         # Test on H2O with multiple occupied pairs
-        n_occ = self.n_occ_h2o
-        for i in range(n_occ):
-            for j in range(i + 1, n_occ):
-                c_ij = evaluate_coupling_functional(
-                    i, j, self.mo_energies_h2o, self.mo_integrals_h2o, n_occ
-                )
-                c_ji = evaluate_coupling_functional(
-                    j, i, self.mo_energies_h2o, self.mo_integrals_h2o, n_occ
-                )
-                
-                self.assertAlmostEqual(
-                    c_ij, c_ji, delta=eps_tol,
-                    msg=f"Symmetry violated for pair ({i},{j}): C({i},{j})={c_ij:.6e} != C({j},{i})={c_ji:.6e}"
-                )
+        c_matrix = self.c_pairwise_h2o
+        np.testing.assert_allclose(
+            c_matrix, c_matrix.T, rtol=0.0, atol=eps_tol,
+            err_msg="Symmetry violated: C(i,j) != C(j,i)"
+        )
 
     def test_non_negativity(self):
         """Test 11.2: Non-negativity property C(i,j) >= 0.
@@ -91,19 +75,13 @@ class CouplingFunctionalTest(unittest.TestCase):
         The coupling functional must be non-negative for all pairs
         due to the absolute value in its definition.
         """
-        n_occ = self.n_occ_h2o
-        
         # Test all pairs including diagonal
-        for i in range(n_occ):
-            for j in range(n_occ):
-                c_ij = evaluate_coupling_functional(
-                    i, j, self.mo_energies_h2o, self.mo_integrals_h2o, n_occ
-                )
-                
-                self.assertGreaterEqual(
-                    c_ij, 0.0,
-                    msg=f"Non-negativity violated for pair ({i},{j}): C({i},{j})={c_ij:.6e} < 0"
-                )
+        c_matrix = self.c_pairwise_h2o
+        negative = np.argwhere(c_matrix < 0.0)
+        self.assertEqual(
+            len(negative), 0,
+            msg=f"Non-negativity violated for pairs {negative.tolist()}"
+        )
 
     def test_self_null(self):
         """Test 11.3: Self-null property C(i,i) = 0.
@@ -112,17 +90,12 @@ class CouplingFunctionalTest(unittest.TestCase):
         due to Brillouin's theorem and Pauli exclusion.
         """
         eps_tol = 1e-12  # Numerical tolerance from spec
-        n_occ = self.n_occ_h2o
-        
-        for i in range(n_occ):
-            c_ii = evaluate_coupling_functional(
-                i, i, self.mo_energies_h2o, self.mo_integrals_h2o, n_occ
-            )
-            
-            self.assertAlmostEqual(
-                c_ii, 0.0, delta=eps_tol,
-                msg=f"Self-null property violated for orbital {i}: C({i},{i})={c_ii:.6e} != 0"
-            )
+
+        diagonal = np.diag(self.c_pairwise_h2o)
+        self.assertLess(
+            np.max(np.abs(diagonal)), eps_tol,
+            msg=f"Self-null property violated: C(i,i)={diagonal.tolist()}"
+        )
 
     def test_pair_energy_reproduction_h2o(self):
         """Test 11.4: Pair energy reproduction for H₂O/STO-3G.
@@ -142,21 +115,36 @@ class CouplingFunctionalTest(unittest.TestCase):
         
         for i in range(n_occ):
             for j in range(i + 1, n_occ):
-                # Compute signed pair energy (before absolute value)
+                # Brute-force signed pair energy (before absolute value)
                 e_pair = self._compute_signed_pair_energy(
                     i, j, self.mo_energies_h2o, self.mo_integrals_h2o, n_occ
                 )
                 pair_energies[(i, j)] = e_pair
                 total_corr_energy += e_pair
-                
-                # Verify that C(i,j) equals |E_pair^MP2(i,j)|
-                c_ij = evaluate_coupling_functional(
-                    i, j, self.mo_energies_h2o, self.mo_integrals_h2o, n_occ
+
+                # Verify the signed kernel value against the reference
+                e_signed, c_ij = evaluate_coupling_functional(
+                    i, j, self.mo_energies_h2o, self.mo_integrals_h2o, n_occ,
+                    vir_pair_sum=self.vir_pair_sum_h2o, return_signed=True
                 )
+                self.assertAlmostEqual(
+                    e_signed, e_pair, places=10,
+                    msg=f"E_pair({i},{j}) mismatch: {e_signed:.6e} != {e_pair:.6e}"
+                )
+
+                # Verify that C(i,j) equals |E_pair^MP2(i,j)| in the
+                # return_signed tuple
                 self.assertAlmostEqual(
                     c_ij, abs(e_pair), places=10,
                     msg=f"C({i},{j}) != |E_pair({i},{j})|: {c_ij:.6e} != {abs(e_pair):.6e}"
                 )
+
+                # ... and for the value returned without return_signed
+                # (shared pairwise C matrix from setUpClass)
+                self.assertAlmostEqual(
+                    self.c_pairwise_h2o[i, j], abs(e_pair), places=10,
+                    msg=f"C({i},{j}) != |E_pair({i},{j})|: {self.c_pairwise_h2o[i, j]:.6e} != {abs(e_pair):.6e}"
+                )
         
         # Compare against pyscf MP2 reference (approximate check)
         # For H2O/STO-3G, MP2 correlation energy is approximately -0.036 Hartree
@@ -219,23 +207,108 @@ class CouplingFunctionalTest(unittest.TestCase):
             )
         self.assertIn("inconsistent", str(cm.exception).lower())
 
+    def test_precomputed_vir_pair_sum(self):
+        """Test a precomputed virtual pair sum reproduces the default path."""
+        n_occ = self.n_occ_h2o
+
+        c_default = evaluate_coupling_functional(
+            0, 1, self.mo_energies_h2o, self.mo_integrals_h2o, n_occ
+        )
+        c_precomputed = evaluate_coupling_functional(
+            0, 1, self.mo_energies_h2o, self.mo_integrals_h2o, n_occ,
+            vir_pair_sum=self.vir_pair_sum_h2o
+        )
+        self.assertEqual(c_default, c_precomputed)
+
+        with self.assertRaises(ValueError) as cm:
+            evaluate_coupling_functional(
+                0, 1, self.mo_energies_h2o, self.mo_integrals_h2o, n_occ,
+                vir_pair_sum=np.zeros((1, 1))
+            )
+        self.assertIn("inconsistent", str(cm.exception).lower())
+
     def test_determinism(self):
-        """Test 11.7: Determinism - repeated calls yield identical results."""
+        """Test 11.7: Determinism - repeated calls yield identical results.
+
+        The functional must not depend on, nor consume, the global RNG: under
+        any seed it returns the reference value bitwise and leaves the RNG
+        state untouched.
+        """
         n_occ = self.n_occ_h2o
-        
-        # Compute coupling functional multiple times
-        results = []
-        for _ in range(5):
+        self.addCleanup(np.random.set_state, np.random.get_state())
+
+        c_ref = evaluate_coupling_functional(
+            0, 1, self.mo_energies_h2o, self.mo_integrals_h2o, n_occ
+        )
+
+        for seed in (0, 1, 42, 12345):
+            np.random.seed(seed)
+            _, keys_before, pos_before, *_ = np.random.get_state()
+            keys_before = keys_before.copy()
+
             c_01 = evaluate_coupling_functional(
                 0, 1, self.mo_energies_h2o, self.mo_integrals_h2o, n_occ
             )
-            results.append(c_01)
-        
-        # All results must be bitwise identical
-        for r in results[1:]:
+
+            # All results must be bitwise identical
             self.assertEqual(
-                r, results[0],
-                msg="Determinism violated: repeated calls produce different results"
+                c_01, c_ref,
+                msg=f"Determinism violated: result differs under seed {seed}"
+            )
+            _, keys_after, pos_after, *_ = np.random.get_state()
+            self.assertTrue(
+                np.array_equal(keys_before, keys_after) and pos_before == pos_after,
+                msg="evaluate_coupling_functional consumed the global RNG"
+            )
+
+    def test_coupling_matrix_matches_pairwise(self):
+        """Test the vectorized C matrix reproduces per-pair evaluations."""
+        eps_tol = 1e-12
+        n_occ = self.n_occ_h2o
+
+        c_matrix = evaluate_coupling_matrix(
+            self.mo_energies_h2o, self.mo_integrals_h2o, n_occ
+        )
+        self.assertEqual(c_matrix.shape, (n_occ, n_occ))
+
+        np.testing.assert_allclose(c_matrix, self.c_pairwise_h2o, rtol=0.0, atol=eps_tol)
+
+    def test_oovv_block_input(self):
+        """Test the pre-sliced (occ, occ, virt, virt) block matches the full tensor."""
+        n_occ = self.n_occ_h2o
+        self.assertEqual(self.g_oovv_h2o.shape, (n_occ, n_occ, 2, 2))
+        self.assertTrue(self.g_oovv_h2o.flags.c_contiguous)
+
+        for i, j in [(0, 1), (2, 4), (3, 3)]:
+            self.assertEqual(
+                evaluate_coupling_functional(i, j, self.mo_energies_h2o, self.g_oovv_h2o, n_occ),
+                evaluate_coupling_functional(i, j, self.mo_energies_h2o, self.mo_integrals_h2o, n_occ)
+            )
+        np.testing.assert_array_equal(
+            evaluate_coupling_matrix(self.mo_energies_h2o, self.g_oovv_h2o, n_occ),
+            evaluate_coupling_matrix(self.mo_energies_h2o, self.mo_integrals_h2o, n_occ)
+        )
+
+    def test_coupling_matrix_float32(self):
+        """Test the float32 coupling matrix tracks the float64 reference."""
+        n_occ = self.n_occ_h2o
+
+        c64 = evaluate_coupling_matrix(self.mo_energies_h2o, self.mo_integrals_h2o, n_occ)
+        c32 = evaluate_coupling_matrix(
+            self.mo_energies_h2o, self.mo_integrals_h2o, n_occ, dtype=np.float32
+        )
+        self.assertEqual(c32.dtype, np.float32)
+        np.testing.assert_allclose(c32, c64, rtol=1e-4, atol=1e-9)
+
+        with self.assertRaises(ValueError):
+            evaluate_coupling_matrix(
+                self.mo_energies_h2o, self.mo_integrals_h2o, n_occ, dtype=np.int64
+            )
+
+        # Only single and double precision are supported
+        with self.assertRaises(ValueError):
+            evaluate_coupling_matrix(
+                self.mo_energies_h2o, self.mo_integrals_h2o, n_occ, dtype=np.float16
             )
 
     def test_build_pair_set_integration(self):
@@ -291,8 +364,9 @@ class CouplingFunctionalTest(unittest.TestCase):
     def _compute_signed_pair_energy(self, i, j, mo_energies, mo_integrals, n_occ):
         """Compute signed MP2 pair energy (before absolute value).
         
-        This is a duplicate of the logic in evaluate_coupling_functional
-        but returns the signed value for validation purposes.
+        Brute-force reference for test 11.4: an explicit (a, b) loop over
+        the full integral tensor, kept independent of the vectorized
+        formulation used by evaluate_coupling_functional.
         """
         if i == j:
             return 0.0
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import unittest
+from dataclasses import FrozenInstanceError
 
 from tangelo.dlpno.structures import (
     OrbitalSpace,
@@ -37,8 +38,8 @@ class StructuresEmptyTest(unittest.TestCase):
     def test_pno_parameters_creation(self):
         """Test PNOParameters can be instantiated."""
         params = PNOParameters(
-            pno_tau_sequence=[1e-4, 1e-5],
-            pair_tau_sequence=[1e-6, 1e-7],
+            pno_tau_sequence=(1e-4, 1e-5),
+            pair_tau_sequence=(1e-6, 1e-7),
             energy_abs_tol=1e-6,
             energy_rel_tol=1e-7,
             max_extrap_points=3
@@ -68,6 +69,25 @@ class StructuresEmptyTest(unittest.TestCase):
         self.assertEqual(record.energy, -100.0)
         self.assertEqual(record.residual_norm, 1e-5)
         self.assertFalse(record.converged)
+
+    def test_value_objects_are_frozen(self):
+        """Test ConvergenceCriteria and ConvergenceRecord are immutable and hashable."""
+        criteria = ConvergenceCriteria(energy_abs_tol=1e-6, energy_rel_tol=1e-7)
+        record = ConvergenceRecord(iteration=1, energy=-100.0, residual_norm=1e-5, converged=False)
+
+        with self.assertRaises(FrozenInstanceError):
+            criteria.energy_abs_tol = 1e-8
+        with self.assertRaises(FrozenInstanceError):
+            record.converged = True
+
+        self.assertEqual(hash(criteria), hash(ConvergenceCriteria(energy_abs_tol=1e-6, energy_rel_tol=1e-7)))
+
+    def test_structures_use_slots(self):
+        """Test data structures do not carry a per-instance __dict__."""
+        for obj in (OrbitalSpace(), default_pno_parameters(),
+                    ConvergenceCriteria(energy_abs_tol=1e-6, energy_rel_tol=1e-7),
+                    ConvergenceRecord(iteration=0, energy=None, residual_norm=None, converged=False)):
+            self.assertFalse(hasattr(obj, "__dict__"), msg=f"{type(obj).__name__} has a __dict__")
     
     def test_default_pno_parameters(self):
         """Test default_pno_parameters function."""
@@ -75,6 +95,8 @@ class StructuresEmptyTest(unittest.TestCase):
         self.assertIsInstance(params, PNOParameters)
         self.assertEqual(len(params.pno_tau_sequence), 5)
         self.assertEqual(len(params.pair_tau_sequence), 3)
+        self.assertIsInstance(params.pno_tau_sequence, tuple)
+        self.assertIsInstance(params.pair_tau_sequence, tuple)
         self.assertEqual(params.max_extrap_points, 3)
 
 
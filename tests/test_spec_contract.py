@@ -25,42 +25,144 @@ These tests validate the structural integrity of the Phase1 specification:
 
 import json
 import os
+import numpy as np
 import pytest
+import re
 import yaml
 from pathlib import Path
 
+from tangelo.dlpno.energy_assembler import EnergyAssembler, IncompletePipelineError, SpecContractError
+from tangelo.dlpno.spec_version import SPEC_VERSION
+
+# Prefer the libyaml-backed loader; fall back to the pure-Python one when
+# PyYAML was built without libyaml.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# orjson is optional; stdlib json.loads also accepts UTF-8 bytes.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+# Repository root contains setup.py; spec files live under spec/
+SPEC_DIR = Path(__file__).parent.parent / "spec"
+
+REQUIRED_LOG_FIELDS = frozenset({
+    "run_uuid",
+    "spec_version",
+    "git_hash",
+    "thresholds",
+    "system",
+    "molecule",
+    "stage",
+    "timestamp_start",
+})
+
+REQUIRED_SPEC_SECTIONS = (
+    "§1. Scope and Purpose",
+    "§2. Pipeline Architecture",
+    "§3. Terminology and Definitions",
+    "§4. Invariants and Determinism Rules",
+    "§5. Error Classes",
+    "§6. Contract Testing",
+    "§7. Accuracy Targets",
+    "§8. Phase List and Deliverables",
+    "§9. Log Schema and Metadata",
+    "§10. Spec Version and Change Control",
+)
+SPEC_MD_VERSION = "0.1.0"
+_SPEC_MD_RE = re.compile("|".join(map(re.escape, REQUIRED_SPEC_SECTIONS + (SPEC_MD_VERSION,))))
+
+REQUIRED_PHASES = frozenset(f"Phase{n}" for n in range(1, 11))
+_PHASE_RE = re.compile(r"Phase(?:10|[1-9])\b")
+
+# Checked schema validators, keyed by the canonical JSON text of the schema
+_VALIDATOR_CACHE = {}
+
+
+def _get_validator(schema):
+    """Return a validator for ``schema``, building it once per distinct schema.
+
+    The validator class follows the draft declared in ``"$schema"``.
+
+    Args:
+        schema (dict): Parsed JSON Schema.
+
+    Returns:
+        jsonschema.protocols.Validator: Validator for ``schema``, or None if
+            jsonschema is not installed.
+    """
+    try:
+        from jsonschema.validators import validator_for
+    except ImportError:
+        return None
+    
+    key = json.dumps(schema, sort_keys=True)
+    validator = _VALIDATOR_CACHE.get(key)
+    if validator is None:
+        validator_cls = validator_for(schema)
+        validator_cls.check_schema(schema)
+        validator = _VALIDATOR_CACHE[key] = validator_cls(schema)
+    return validator
+
+
+@pytest.fixture(scope="session")
+def spec_files():
+    """Load and parse every spec file once per test session.
+
+    Returns:
+        dict: Parsed ``thresholds`` (YAML), ``log_schema`` (JSON), its
+            ``log_validator`` (None without jsonschema), and the raw text of
+            ``validation_matrix`` and ``spec_md``.
+    """
+    assert SPEC_DIR.is_dir(), f"Spec directory not found: {SPEC_DIR}"
+    
+    paths = {
+        "thresholds": SPEC_DIR / "thresholds.yaml",
+        "log_schema": SPEC_DIR / "log_schema.json",
+        "validation_matrix": SPEC_DIR / "validation_matrix.md",
+        "spec_md": SPEC_DIR / "spec.md",
+    }
+    for path in paths.values():
+        assert path.is_file(), f"{path.name} not found: {path}"
+    
+    files = {}
+    files["thresholds"] = yaml.load(paths["thresholds"].read_bytes(), Loader=_YamlLoader)
+    files["log_schema"] = _json_loads(paths["log_schema"].read_bytes())
+    files["validation_matrix"] = paths["validation_matrix"].read_text(encoding="utf-8")
+    files["spec_md"] = paths["spec_md"].read_text(encoding="utf-8")
+    
+    files["log_validator"] = _get_validator(files["log_schema"])
+    
+    return files
+
+
+@pytest.fixture(scope="module")
+def assembler():
+    """Phase1 EnergyAssembler shared by the guard tests (getters do not mutate it)."""
+    return EnergyAssembler(scf_energy=-75.0)
+
 
 class TestSpecContract:
     """Test suite for DLPNO Phase1 specification contracts."""
     
-    @classmethod
-    def setup_class(cls):
-        """Locate spec files relative to repository root."""
-        # Find repository root (contains setup.py)
-        cls.repo_root = Path(__file__).parent.parent
-        cls.spec_dir = cls.repo_root / "spec"
-        
-        # Verify spec directory exists
-        assert cls.spec_dir.exists(), f"Spec directory not found: {cls.spec_dir}"
-    
     def test_spec_version_import(self):
         """Test SPEC_VERSION constant is accessible.
         
         Spec §6.1: SPEC_VERSION Accessibility
         """
-        from tangelo.dlpno.spec_version import SPEC_VERSION
         assert SPEC_VERSION == "0.1.0", f"Expected SPEC_VERSION='0.1.0', got '{SPEC_VERSION}'"
     
-    def test_thresholds_yaml_structure(self):
+    def test_thresholds_yaml_structure(self, spec_files):
         """Test thresholds.yaml has required keys and correct types.
         
         Spec §6.1: Threshold Integrity
         """
-        thresholds_path = self.spec_dir / "thresholds.yaml"
-        assert thresholds_path.exists(), f"thresholds.yaml not found: {thresholds_path}"
-        
-        with open(thresholds_path, 'r') as f:
-            thresholds = yaml.safe_load(f)
+        thresholds = spec_files["thresholds"]
         
         # Required threshold keys
         required_keys = [
@@ -105,37 +207,26 @@ class TestSpecContract:
         assert len(pno_seq) > 0, "PNO_TAU_SEQUENCE must not be empty"
         assert len(pair_seq) > 0, "PAIR_TAU_SEQUENCE must not be empty"
     
-    def test_thresholds_monotonicity(self):
+    def test_thresholds_monotonicity(self, spec_files):
         """Test that threshold sequences are strictly decreasing.
         
         Spec §11: Threshold Monotonicity Constraints
         """
-        thresholds_path = self.spec_dir / "thresholds.yaml"
-        with open(thresholds_path, 'r') as f:
-            thresholds = yaml.safe_load(f)
-        
-        # Check PNO sequence monotonicity
-        pno_seq = thresholds["PNO_TAU_SEQUENCE"]["values"]
-        for i in range(len(pno_seq) - 1):
-            assert pno_seq[i] > pno_seq[i+1], \
-                f"PNO_TAU_SEQUENCE not strictly decreasing: {pno_seq[i]} <= {pno_seq[i+1]}"
-        
-        # Check PAIR sequence monotonicity
-        pair_seq = thresholds["PAIR_TAU_SEQUENCE"]["values"]
-        for i in range(len(pair_seq) - 1):
-            assert pair_seq[i] > pair_seq[i+1], \
-                f"PAIR_TAU_SEQUENCE not strictly decreasing: {pair_seq[i]} <= {pair_seq[i+1]}"
+        thresholds = spec_files["thresholds"]
+        
+        for key in ("PNO_TAU_SEQUENCE", "PAIR_TAU_SEQUENCE"):
+            seq = np.asarray(thresholds[key]["values"], dtype=np.float64)
+            decreasing = seq[:-1] > seq[1:]
+            if not np.all(decreasing):
+                k = int(np.argmin(decreasing))
+                pytest.fail(f"{key} not strictly decreasing: {seq[k]} <= {seq[k+1]}")
     
-    def test_log_schema_json_validity(self):
+    def test_log_schema_json_validity(self, spec_files):
         """Test log_schema.json is valid JSON Schema.
         
         Spec §6.1: Schema Compliance
         """
-        schema_path = self.spec_dir / "log_schema.json"
-        assert schema_path.exists(), f"log_schema.json not found: {schema_path}"
-        
-        with open(schema_path, 'r') as f:
-            schema = json.load(f)
+        schema = spec_files["log_schema"]
         
         # Verify it's a valid JSON Schema structure
         assert "$schema" in schema, "Missing $schema field"
@@ -146,29 +237,18 @@ class TestSpecContract:
         assert "properties" in schema, "Missing properties field"
         
         # Verify required fields are present
-        required_fields = [
-            "run_uuid",
-            "spec_version",
-            "git_hash",
-            "thresholds",
-            "system",
-            "molecule",
-            "stage",
-            "timestamp_start"
-        ]
-        for field in required_fields:
-            assert field in schema["required"], f"Required field '{field}' not in schema"
-            assert field in schema["properties"], f"Required field '{field}' not in properties"
+        missing = REQUIRED_LOG_FIELDS - set(schema["required"])
+        assert not missing, f"Required fields not in schema: {sorted(missing)}"
+        missing = REQUIRED_LOG_FIELDS - schema["properties"].keys()
+        assert not missing, f"Required fields not in properties: {sorted(missing)}"
     
-    def test_log_schema_validates_example(self):
+    def test_log_schema_validates_example(self, spec_files):
         """Test that a synthetic log example validates against schema.
         
         Spec §6.1: Schema Compliance
         Spec §9.1: Required Metadata Fields
         """
-        schema_path = self.spec_dir / "log_schema.json"
-        with open(schema_path, 'r') as f:
-            schema = json.load(f)
+        schema = spec_files["log_schema"]
         
         # Construct minimal synthetic log
         synthetic_log = {
@@ -205,136 +285,79 @@ class TestSpecContract:
         }
         
         # Validate using jsonschema library if available, otherwise basic check
-        try:
-            import jsonschema
-            jsonschema.validate(instance=synthetic_log, schema=schema)
-        except ImportError:
+        log_validator = spec_files["log_validator"]
+        if log_validator is not None:
+            log_validator.validate(synthetic_log)
+        else:
             # If jsonschema not available, just verify structure matches
             for required_field in schema["required"]:
                 assert required_field in synthetic_log, \
                     f"Synthetic log missing required field: {required_field}"
     
-    def test_energy_assembler_guard_mp2(self):
-        """Test EnergyAssembler raises IncompletePipelineError for MP2 energy.
+    def test_energy_assembler_initial_flags(self, assembler):
+        """Test EnergyAssembler starts with every pipeline flag False.
         
-        Spec §5.1: IncompletePipelineError
         Spec §2.2: Pipeline Completeness Conditions
         """
-        from tangelo.dlpno.energy_assembler import EnergyAssembler, IncompletePipelineError
-        
-        assembler = EnergyAssembler(scf_energy=-75.0)
-        
-        # Verify all flags are False initially
-        assert all(not flag for flag in assembler.pipeline_flags.values()), \
+        assert not any(assembler.pipeline_flags.values()), \
             "All pipeline flags should be False in Phase1"
-        
-        # Attempt to get MP2 energy should raise
-        with pytest.raises(IncompletePipelineError) as exc_info:
-            assembler.get_mp2_energy(mode="FULL")
-        
-        assert "pipeline incomplete" in str(exc_info.value).lower()
     
-    def test_energy_assembler_guard_ccsd(self):
-        """Test EnergyAssembler raises IncompletePipelineError for CCSD energy.
+    @pytest.mark.parametrize("method", ["get_mp2_energy", "get_ccsd_energy", "get_ccsd_t_energy"])
+    def test_energy_assembler_guard(self, assembler, method):
+        """Test EnergyAssembler raises IncompletePipelineError for MP2, CCSD and CCSD(T) energies.
         
         Spec §5.1: IncompletePipelineError
+        Spec §2.2: Pipeline Completeness Conditions
         """
-        from tangelo.dlpno.energy_assembler import EnergyAssembler, IncompletePipelineError
-        
-        assembler = EnergyAssembler(scf_energy=-75.0)
-        
         with pytest.raises(IncompletePipelineError) as exc_info:
-            assembler.get_ccsd_energy(mode="FULL")
+            getattr(assembler, method)(mode="FULL")
         
         assert "pipeline incomplete" in str(exc_info.value).lower()
     
-    def test_energy_assembler_guard_ccsd_t(self):
-        """Test EnergyAssembler raises IncompletePipelineError for CCSD(T) energy.
+    @pytest.mark.parametrize("level", ["MP2", "CCSD", "CCSD(T)"])
+    def test_energy_assembler_guard_correlation(self, assembler, level):
+        """Test EnergyAssembler raises IncompletePipelineError for correlation energy.
         
         Spec §5.1: IncompletePipelineError
         """
-        from tangelo.dlpno.energy_assembler import EnergyAssembler, IncompletePipelineError
-        
-        assembler = EnergyAssembler(scf_energy=-75.0)
-        
         with pytest.raises(IncompletePipelineError) as exc_info:
-            assembler.get_ccsd_t_energy(mode="FULL")
+            assembler.get_correlation_energy(level=level, mode="FULL")
         
         assert "pipeline incomplete" in str(exc_info.value).lower()
     
-    def test_energy_assembler_guard_correlation(self):
-        """Test EnergyAssembler raises IncompletePipelineError for correlation energy.
-        
-        Spec §5.1: IncompletePipelineError
-        """
-        from tangelo.dlpno.energy_assembler import EnergyAssembler, IncompletePipelineError
-        
-        assembler = EnergyAssembler(scf_energy=-75.0)
-        
-        for level in ["MP2", "CCSD", "CCSD(T)"]:
-            with pytest.raises(IncompletePipelineError) as exc_info:
-                assembler.get_correlation_energy(level=level, mode="FULL")
-            
-            assert "pipeline incomplete" in str(exc_info.value).lower()
-    
-    def test_validation_matrix_exists(self):
+    def test_validation_matrix_exists(self, spec_files):
         """Test validation_matrix.md exists and has content.
         
         Spec §6.2: Validation Matrix
         """
-        matrix_path = self.spec_dir / "validation_matrix.md"
-        assert matrix_path.exists(), f"validation_matrix.md not found: {matrix_path}"
-        
-        with open(matrix_path, 'r') as f:
-            content = f.read()
+        content = spec_files["validation_matrix"]
         
         # Verify it mentions all phases (Phase1 through Phase10)
-        for phase_num in range(1, 11):
-            assert f"Phase{phase_num}" in content, \
-                f"validation_matrix.md must mention Phase{phase_num}"
+        missing = REQUIRED_PHASES - set(_PHASE_RE.findall(content))
+        assert not missing, f"validation_matrix.md must mention {sorted(missing)}"
         
         # Verify table structure keywords present
         assert "Verification Method" in content, "Missing 'Verification Method' column"
         assert "Acceptance Criteria" in content, "Missing 'Acceptance Criteria' column"
     
-    def test_spec_md_exists(self):
+    def test_spec_md_exists(self, spec_files):
         """Test spec.md exists and has all required sections.
         
         Spec §1-§13: Full specification document
         """
-        spec_path = self.spec_dir / "spec.md"
-        assert spec_path.exists(), f"spec.md not found: {spec_path}"
+        content = spec_files["spec_md"]
         
-        with open(spec_path, 'r') as f:
-            content = f.read()
-        
-        # Verify key sections exist
-        required_sections = [
-            "§1. Scope and Purpose",
-            "§2. Pipeline Architecture",
-            "§3. Terminology and Definitions",
-            "§4. Invariants and Determinism Rules",
-            "§5. Error Classes",
-            "§6. Contract Testing",
-            "§7. Accuracy Targets",
-            "§8. Phase List and Deliverables",
-            "§9. Log Schema and Metadata",
-            "§10. Spec Version and Change Control",
-        ]
-        
-        for section in required_sections:
-            assert section in content, f"spec.md missing required section: {section}"
-        
-        # Verify version is mentioned
-        assert "0.1.0" in content, "spec.md must mention version 0.1.0"
+        # Verify key sections and the version in a single scan
+        found = {m.group(0) for m in _SPEC_MD_RE.finditer(content)}
+        missing = [s for s in REQUIRED_SPEC_SECTIONS if s not in found]
+        assert not missing, f"spec.md missing required sections: {missing}"
+        assert SPEC_MD_VERSION in found, f"spec.md must mention version {SPEC_MD_VERSION}"
     
     def test_error_classes_defined(self):
         """Test that error classes are defined and importable.
         
         Spec §5: Error Classes
         """
-        from tangelo.dlpno.energy_assembler import IncompletePipelineError, SpecContractError
-        
         # Verify they are Exception subclasses
         assert issubclass(IncompletePipelineError, Exception)
         assert issubclass(SpecContractError, Exception)